@@ -8,6 +8,9 @@ addressing the bot detection issues in yt-dlp.
 Usage:
     python extract_youtube_cookies.py
 
+    # Optional: skip browser profile discovery by naming the profile directly
+    YOUTUBE_COOKIE_BROWSER_PROFILE=firefox:abcd1234.default-release python extract_youtube_cookies.py
+
 Requirements:
     pip install browser-cookie3 requests selenium webdriver-manager
 """
@@ -17,8 +20,13 @@ import sys
 import json
 import base64
 import time
+import shutil
+import sqlite3
+import tempfile
 from pathlib import Path
 from typing import Optional, Dict, List
+from importlib.util import find_spec
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 import subprocess
 
 def print_banner():
@@ -38,13 +46,11 @@ def check_dependencies():
         'webdriver_manager'
     ]
     
-    missing_packages = []
-    
-    for package in required_packages:
-        try:
-            __import__(package.replace('-', '_'))
-        except ImportError:
-            missing_packages.append(package)
+    # find_spec only looks the module up; it doesn't execute it (selenium is heavy)
+    missing_packages = [
+        package for package in required_packages
+        if find_spec(package.replace('-', '_')) is None
+    ]
     
     if missing_packages:
         print("❌ Missing required packages. Please install them:")
@@ -54,6 +60,145 @@ def check_dependencies():
     print("✅ All required packages are installed")
     return True
 
+COOKIE_PROFILE_CACHE = Path.home() / ".cache" / "yt-lyrics" / "cookie_profile"
+
+def get_cookie_db_path(browser_name: str, profile: str) -> Optional[Path]:
+    """Build the cookie database path for a known browser profile"""
+    profile_path = Path(profile).expanduser()
+    if profile_path.is_file():
+        return profile_path
+    
+    home = Path.home()
+    if sys.platform == 'darwin':
+        app_support = home / "Library" / "Application Support"
+        candidates = {
+            'firefox': app_support / "Firefox" / "Profiles" / profile / "cookies.sqlite",
+            'chrome': app_support / "Google" / "Chrome" / profile / "Cookies",
+            'edge': app_support / "Microsoft Edge" / profile / "Cookies",
+            # Opera has no per-profile subdirectory; the profile is its data dir
+            # (e.g. com.operasoftware.Opera)
+            'opera': app_support / profile / "Cookies",
+        }
+    elif sys.platform == 'win32':
+        appdata = Path(os.environ.get('APPDATA', home))
+        local_appdata = Path(os.environ.get('LOCALAPPDATA', home))
+        candidates = {
+            'firefox': appdata / "Mozilla" / "Firefox" / "Profiles" / profile / "cookies.sqlite",
+            'chrome': local_appdata / "Google" / "Chrome" / "User Data" / profile / "Network" / "Cookies",
+            'edge': local_appdata / "Microsoft" / "Edge" / "User Data" / profile / "Network" / "Cookies",
+            'opera': appdata / "Opera Software" / profile / "Network" / "Cookies",  # e.g. "Opera Stable"
+        }
+    else:
+        candidates = {
+            'firefox': home / ".mozilla" / "firefox" / profile / "cookies.sqlite",
+            'chrome': home / ".config" / "google-chrome" / profile / "Cookies",
+            'edge': home / ".config" / "microsoft-edge" / profile / "Cookies",
+            'opera': home / ".config" / profile / "Cookies",  # e.g. "opera"
+        }
+    
+    return candidates.get(browser_name)
+
+def resolve_browser_profile():
+    """Resolve an explicit (browser, cookie_file) pair from env or the cache file"""
+    profile_spec = os.environ.get('YOUTUBE_COOKIE_BROWSER_PROFILE')
+    if profile_spec:
+        browser_name, _, profile = profile_spec.partition(':')
+        browser_name = browser_name.strip().lower()
+        cookie_file = get_cookie_db_path(browser_name, profile.strip()) if profile else None
+        if cookie_file and cookie_file.exists():
+            return browser_name, cookie_file
+        print(f"⚠️ Could not resolve browser profile: {profile_spec}")
+        return None
+    
+    try:
+        browser_name, cookie_file = COOKIE_PROFILE_CACHE.read_text(encoding='utf-8').strip().split('\t', 1)
+        if Path(cookie_file).exists():
+            return browser_name, Path(cookie_file)
+    except (OSError, ValueError):
+        pass
+    
+    return None
+
+def cache_browser_profile(browser_name: str, cookie_file: Path):
+    """Remember a working profile so later runs skip profile discovery"""
+    entry = f"{browser_name}\t{cookie_file}"
+    try:
+        if COOKIE_PROFILE_CACHE.exists() and COOKIE_PROFILE_CACHE.read_text(encoding='utf-8').strip() == entry:
+            return
+        COOKIE_PROFILE_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        COOKIE_PROFILE_CACHE.write_text(entry, encoding='utf-8')
+    except OSError as e:
+        print(f"⚠️ Could not cache browser profile: {e}")
+
+def read_firefox_session_cookies(profile_dir: Path) -> List[Dict]:
+    """Read YouTube session cookies from Firefox's session store
+
+    Session cookies never reach cookies.sqlite; Firefox only keeps them in
+    recovery.jsonlz4 (mozLz4: 8-byte magic, then a size-prefixed LZ4 block).
+    """
+    session_file = profile_dir / "sessionstore-backups" / "recovery.jsonlz4"
+    if not session_file.exists():
+        return []
+    
+    try:
+        import lz4.block  # Installed alongside browser-cookie3
+        session = json.loads(lz4.block.decompress(session_file.read_bytes()[8:]))
+    except Exception as e:
+        print(f"⚠️ Could not read Firefox session cookies: {e}")
+        return []
+    
+    return [
+        {
+            'domain': cookie.get('host', ''),
+            'name': cookie.get('name', ''),
+            'value': cookie.get('value', ''),
+            'path': cookie.get('path', '/'),
+            'secure': bool(cookie.get('secure')),
+            'expires': None
+        }
+        for cookie in session.get('cookies', [])
+        if cookie.get('host', '').endswith(('youtube.com', 'googlevideo.com'))
+    ]
+
+def read_firefox_cookies(db_path: Path) -> List[Dict]:
+    """Read YouTube cookies from a Firefox profile's cookies.sqlite and session store
+
+    The domain filter runs inside SQLite so only matching rows cross into
+    Python. The DB is read from a private copy that includes its -wal file:
+    a running Firefox keeps recent writes (rotated auth cookies) in the WAL
+    until it checkpoints, and an immutable open would ignore them.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_copy = Path(temp_dir) / db_path.name
+        shutil.copy2(db_path, db_copy)
+        wal_path = db_path.with_name(db_path.name + "-wal")
+        if wal_path.exists():
+            shutil.copy2(wal_path, db_copy.with_name(db_copy.name + "-wal"))
+        
+        con = sqlite3.connect(str(db_copy))
+        try:
+            rows = con.execute(
+                "SELECT host, name, value, path, isSecure, expiry FROM moz_cookies "
+                "WHERE host LIKE '%youtube.com' OR host LIKE '%googlevideo.com'"
+            ).fetchall()
+        finally:
+            con.close()
+    
+    cookies = [
+        {
+            'domain': host,
+            'name': name,
+            'value': value,
+            'path': path,
+            'secure': bool(is_secure),
+            # Newer Firefox versions store expiry in milliseconds
+            'expires': expiry // 1000 if expiry and expiry > 10**11 else expiry
+        }
+        for host, name, value, path, is_secure, expiry in rows
+    ]
+    cookies.extend(read_firefox_session_cookies(db_path.parent))
+    return cookies
+
 def method_1_browser_cookies():
     """Method 1: Extract cookies using browser-cookie3"""
     print("\n🔍 Method 1: Browser Cookie Extraction")
@@ -63,37 +208,82 @@ def method_1_browser_cookies():
         import browser_cookie3
         
         browsers = [
-            ('chrome', browser_cookie3.chrome),
-            ('firefox', browser_cookie3.firefox),
-            ('edge', browser_cookie3.edge),
-            ('opera', browser_cookie3.opera),
+            ('chrome', browser_cookie3.Chrome),
+            ('firefox', browser_cookie3.Firefox),
+            ('edge', browser_cookie3.Edge),
+            ('opera', browser_cookie3.Opera),
         ]
-        
-        for browser_name, browser_func in browsers:
+
+        def extract_from_browser(browser_name, browser_cls, **kwargs):
+            """Read one browser's cookie jar; return its YouTube cookies and cookie DB path"""
+            print(f"📋 Trying {browser_name}...")
+            browser = browser_cls(domain_name='youtube.com', **kwargs)
+            cookies = browser.load()
+
+            youtube_cookies = []
+            for cookie in cookies:
+                if 'youtube.com' in cookie.domain or 'googlevideo.com' in cookie.domain:
+                    youtube_cookies.append({
+                        'domain': cookie.domain,
+                        'name': cookie.name,
+                        'value': cookie.value,
+                        'path': cookie.path,
+                        'secure': cookie.secure,
+                        'expires': cookie.expires
+                    })
+            return youtube_cookies, getattr(browser, 'cookie_file', None)
+
+        # Fast path: a known profile skips browser_cookie3's profile discovery
+        known_profile = resolve_browser_profile()
+        browser_classes = dict(browsers)
+        if known_profile and known_profile[0] in browser_classes:
+            browser_name, cookie_file = known_profile
             try:
-                print(f"📋 Trying {browser_name}...")
-                cookies = browser_func(domain_name='youtube.com')
-                
-                youtube_cookies = []
-                for cookie in cookies:
-                    if 'youtube.com' in cookie.domain or 'googlevideo.com' in cookie.domain:
-                        youtube_cookies.append({
-                            'domain': cookie.domain,
-                            'name': cookie.name,
-                            'value': cookie.value,
-                            'path': cookie.path,
-                            'secure': cookie.secure,
-                            'expires': cookie.expires
-                        })
-                
+                if browser_name == 'firefox':
+                    # Firefox values are unencrypted, so skip browser_cookie3 entirely
+                    print(f"📋 Reading {cookie_file}...")
+                    youtube_cookies = read_firefox_cookies(cookie_file)
+                else:
+                    youtube_cookies, _ = extract_from_browser(
+                        browser_name, browser_classes[browser_name], cookie_file=str(cookie_file)
+                    )
                 if youtube_cookies:
-                    print(f"✅ Found {len(youtube_cookies)} YouTube cookies in {browser_name}")
+                    print(f"✅ Found {len(youtube_cookies)} YouTube cookies in {browser_name} ({cookie_file})")
+                    cache_browser_profile(browser_name, cookie_file)
                     return youtube_cookies
-                    
             except Exception as e:
-                print(f"❌ {browser_name} extraction failed: {e}")
-                continue
-        
+                print(f"❌ {browser_name} profile extraction failed: {e}")
+
+        # Cookie DB reads are I/O bound, so probe all browsers concurrently
+        # and take the first one that yields YouTube cookies
+        executor = ThreadPoolExecutor(max_workers=len(browsers))
+        futures = {
+            executor.submit(extract_from_browser, browser_name, browser_cls): browser_name
+            for browser_name, browser_cls in browsers
+        }
+
+        try:
+            for future in as_completed(futures, timeout=15):
+                browser_name = futures[future]
+                try:
+                    youtube_cookies, cookie_file = future.result()
+                except Exception as e:
+                    print(f"❌ {browser_name} extraction failed: {e}")
+                    continue
+
+                if youtube_cookies:
+                    print(f"✅ Found {len(youtube_cookies)} YouTube cookies in {browser_name}")
+                    # Remember the discovered profile so the next run takes the fast path
+                    if cookie_file:
+                        cache_browser_profile(browser_name, Path(cookie_file))
+                    return youtube_cookies
+        except FuturesTimeoutError:
+            print("⏰ Browser cookie extraction timed out")
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
         print("❌ No YouTube cookies found in any browser")
         return None
         
@@ -125,15 +315,13 @@ def method_2_manual_cookie_input():
     print("")
     print("Enter your cookies (press Enter twice when done):")
     
-    cookies_text = ""
-    while True:
-        line = input()
-        if not line:
-            break
-        cookies_text += line + "\n"
+    lines = []
+    while line := input():
+        lines.append(line)
     
-    if cookies_text.strip():
-        return cookies_text.strip()
+    cookies_text = "\n".join(lines).strip()
+    if cookies_text:
+        return cookies_text
     
     return None
 
@@ -204,24 +392,17 @@ def validate_cookies(cookie_text: str) -> bool:
         return False
     
     lines = cookie_text.strip().split('\n')
-    valid_cookies = 0
+    current_time = int(time.time())
     
-    for line in lines:
-        line = line.strip()
-        if not line or line.startswith('#'):
-            continue
-        
-        parts = line.split('\t')
-        if len(parts) >= 7:
-            try:
-                # Check expiration timestamp
-                expiration = int(parts[4])
-                current_time = int(time.time())
-                
-                if expiration > current_time:  # Not expired
-                    valid_cookies += 1
-            except ValueError:
-                continue
+    def is_valid(line: str) -> bool:
+        parts = line.split('\t', 7)
+        # Check expiration timestamp; isdigit() avoids try/except per line
+        return len(parts) >= 7 and parts[4].isdigit() and int(parts[4]) > current_time
+    
+    valid_cookies = sum(
+        1 for line in map(str.strip, lines)
+        if line and not line.startswith('#') and is_valid(line)
+    )
     
     print(f"📊 Cookie validation: {valid_cookies} valid, {len(lines)} total")
     return valid_cookies > 0
@@ -262,6 +443,33 @@ def test_cookies_with_yt_dlp(cookie_file: str) -> bool:
     
     test_url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"  # Short test video
     
+    # Prefer the in-process API: no second interpreter start, typed errors
+    try:
+        from yt_dlp import YoutubeDL
+        from yt_dlp.utils import DownloadError
+    except ImportError:
+        YoutubeDL = None
+    
+    if YoutubeDL is not None:
+        ydl_opts = {
+            'cookiefile': cookie_file,
+            'skip_download': True,
+            'quiet': True,
+            'no_warnings': True,
+            'socket_timeout': 30,
+        }
+        try:
+            with YoutubeDL(ydl_opts) as ydl:
+                ydl.extract_info(test_url, download=False)
+            print("✅ Cookie test successful!")
+            return True
+        except DownloadError as e:
+            print(f"❌ Cookie test failed: {e}")
+            return False
+        except Exception as e:
+            print(f"❌ Cookie test error: {e}")
+            return False
+    
     cmd = [
         "yt-dlp",
         "--cookies", cookie_file,
@@ -316,15 +524,12 @@ def main():
             # Handle different return types
             if isinstance(result, list):  # Browser cookies
                 # Convert to Netscape format
-                netscape_lines = []
-                for cookie in result:
-                    secure = 'TRUE' if cookie.get('secure', False) else 'FALSE'
-                    expires = cookie.get('expires', 0) or int(time.time()) + 31536000  # 1 year default
-                    
-                    netscape_lines.append(
-                        f"{cookie['domain']}\tFALSE\t{cookie['path']}\t{secure}\t{expires}\t{cookie['name']}\t{cookie['value']}"
-                    )
-                cookies_text = "\n".join(netscape_lines)
+                default_expires = int(time.time()) + 31536000  # 1 year default
+                cookies_text = "\n".join(
+                    f"{cookie['domain']}\tFALSE\t{cookie['path']}\t{'TRUE' if cookie.get('secure') else 'FALSE'}\t"
+                    f"{cookie.get('expires') or default_expires}\t{cookie['name']}\t{cookie['value']}"
+                    for cookie in result
+                )
             else:  # String cookies
                 cookies_text = result
             
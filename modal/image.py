@@ -6,17 +6,15 @@ image = modal.Image.debian_slim(python_version="3.11").pip_install([
     "torch>=2.0.0",
     "torchaudio>=2.0.0", 
     "transformers>=4.30.0",
-    "librosa>=0.10.0",
     "soundfile>=0.12.0",
     "scipy>=1.10.0",
     "numpy>=1.24.0",
     
     # YouTube download and processing
-    "yt-dlp>=2024.12.13",
-    "demucs>=4.0.1",
+    "yt-dlp==2026.8.19",  # Pinned for reproducible builds; bump deliberately
     
     # Whisper and transcription
-    "openai-whisper>=20231117",
+    "faster-whisper>=1.1.0",
     "whisperx>=3.1.1",
     
     # OpenAI API
@@ -32,18 +30,9 @@ image = modal.Image.debian_slim(python_version="3.11").pip_install([
     # FastAPI for web endpoints
     "fastapi[standard]>=0.100.0"
 ]).apt_install([
-    # System dependencies for audio processing
+    # Runtime system dependencies for audio processing (all Python deps ship wheels)
     "ffmpeg",
-    "libsndfile1-dev", 
-    "gcc",
-    "g++",
-    "wget",
-    "libcurl4-openssl-dev",
-    "libffi-dev",
-    "libssl-dev"
-]).run_commands([
-    # Install latest yt-dlp from GitHub for best YouTube compatibility
-    "pip install --upgrade --force-reinstall git+https://github.com/yt-dlp/yt-dlp.git"
+    "libsndfile1"
 ])
 
 # Export the image for use in other Modal functions
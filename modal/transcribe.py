@@ -5,23 +5,37 @@ import tempfile
 import subprocess
 import shutil
 import time
+import threading
+import functools
+from contextlib import contextmanager, nullcontext
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional, Callable, List
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import base64
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 # Modal app definition
 app = modal.App("youtube-transcription-v3")
 
+# Model weights live on a persistent volume so cold containers read them from
+# disk instead of re-downloading from the Hugging Face hub
+MODEL_DIR = "/models"
+weights_volume = modal.Volume.from_name("transcription-model-weights", create_if_missing=True)
+
 # Modal image with all dependencies
 image = (
     modal.Image.debian_slim()
+    .apt_install(["ffmpeg", "git"])
     .pip_install([
         "yt-dlp",
-        "faster-whisper",
+        "faster-whisper>=1.1.0",
         "torch",
         "torchaudio",
         "openai",
@@ -29,29 +43,23 @@ image = (
         "cloudinary",
         "requests",
         "numpy",
-        "librosa",
         "soundfile",
         "pydub",
         "ffmpeg-python",
+        "orjson",
+        "psutil",  # Resource monitoring during transcription
         "fastapi"  # Add FastAPI for web endpoints
     ])
-    .apt_install(["ffmpeg", "git"])
-).pip_install([
-    "yt-dlp",
-    "faster-whisper",
-    "torch",
-    "torchaudio",
-    "openai",
-    "groq",
-    "cloudinary",
-    "requests",
-    "numpy",
-    "librosa",
-    "soundfile",
-    "pydub",
-    "ffmpeg-python",
-    "fastapi"  # Add FastAPI for web endpoints
-])
+    .env({"HF_HOME": f"{MODEL_DIR}/huggingface"})
+)
+
+# Heavy ML imports resolve once at container start instead of inside the first
+# request; Modal skips them when this module is imported locally for deploy
+with image.imports():
+    import torch
+    from faster_whisper import BatchedInferencePipeline, WhisperModel
+    from groq import Groq
+    from openai import OpenAI
 
 def validate_cookies(cookie_content):
     """Validate Netscape cookie format and expiration"""
@@ -157,6 +165,7 @@ def check_cudnn_availability():
         print(f"[cuDNN] ⚠️ cuDNN check failed: {e}")
         return False
 
+@functools.lru_cache(maxsize=None)  # Hardware doesn't change within a container
 def get_optimal_device_and_compute_type():
     """Determine optimal device and compute type based on hardware"""
     cuda_available, gpu_count, gpu_name = detect_cuda_availability()
@@ -165,7 +174,8 @@ def get_optimal_device_and_compute_type():
     if cuda_available and cudnn_available:
         # Full GPU acceleration available
         device = "cuda"
-        compute_type = "float16"  # Best for modern GPUs with cuDNN
+        # INT8 weights, FP16 activations on tensor cores; FW_COMPUTE_TYPE=float16 opts out
+        compute_type = os.environ.get("FW_COMPUTE_TYPE", "int8_float16")
         print(f"[GPU] 🚀 Using GPU acceleration: {gpu_name} with cuDNN")
     elif cuda_available:
         # CUDA available but no cuDNN
@@ -195,8 +205,9 @@ def chunk_audio_for_groq(audio_path, max_size_mb=20):
         
         print(f"[Groq] Audio file size ({file_size_mb:.1f}MB) exceeds limit ({max_size_mb}MB), chunking required")
         
-        # Load audio file
-        audio = AudioSegment.from_file(str(audio_path))
+        # Load audio file and downmix to 16kHz mono up front: Whisper resamples
+        # to this anyway, and it shrinks every chunk written to disk
+        audio = AudioSegment.from_file(str(audio_path)).set_channels(1).set_frame_rate(16000)
         duration_ms = len(audio)
         
         # Calculate chunk size (aim for 10-15 minute chunks)
@@ -219,9 +230,9 @@ def chunk_audio_for_groq(audio_path, max_size_mb=20):
             chunk = audio[chunk_start:chunk_end]
             
             # Export chunk
-            chunk_filename = f"chunk_{i:03d}_{start_time//1000}s-{end_time//1000}s.wav"
+            chunk_filename = f"chunk_{i:03d}_{start_time//1000}s-{end_time//1000}s.flac"
             chunk_path = temp_dir / chunk_filename
-            chunk.export(str(chunk_path), format="wav")
+            chunk.export(str(chunk_path), format="flac")
             
             chunks.append(chunk_path)
             print(f"[Groq] Created chunk {i+1}/{num_chunks}: {chunk_path.name} ({len(chunk)/1000:.1f}s)")
@@ -285,99 +296,6 @@ def merge_chunked_transcriptions(chunk_results, original_audio_path):
         # Return first chunk result as fallback
         return chunk_results[0] if chunk_results else None
 
-def safe_gpu_memory_cleanup():
-    """Safely clean up GPU memory with error handling"""
-    try:
-        import torch
-        import gc
-        
-        if torch.cuda.is_available():
-            # Clear CUDA cache
-            torch.cuda.empty_cache()
-            
-            # Force garbage collection
-            gc.collect()
-            
-            # Get memory stats
-            if torch.cuda.device_count() > 0:
-                memory_allocated = torch.cuda.memory_allocated(0) / (1024**2)
-                memory_reserved = torch.cuda.memory_reserved(0) / (1024**3)
-                print(f"[GPU] 🧹 Memory cleanup: {memory_allocated:.2f}GB allocated, {memory_reserved:.2f}GB reserved")
-            else:
-                print("[GPU] 🧹 Memory cleanup completed (no GPU)")
-        else:
-            print("[GPU] 🧹 CPU cleanup completed")
-            
-    except Exception as e:
-        print(f"[GPU] ⚠️ Memory cleanup warning: {e}")
-
-def setup_signal_handlers():
-    """Set up signal handlers for graceful shutdown"""
-    import signal
-    import sys
-    
-    def signal_handler(signum, frame):
-        """Handle termination signals gracefully"""
-        signal_name = signal.Signals(signum).name
-        print(f"[Signal] Received {signal_name}, initiating graceful shutdown...")
-        
-        try:
-            # Clean up GPU memory
-            safe_gpu_memory_cleanup()
-            
-            # Clean up temporary files
-            cleanup_temp_files()
-            
-            print(f"[Signal] Graceful shutdown completed for {signal_name}")
-            
-        except Exception as e:
-            print(f"[Signal] Error during shutdown: {e}")
-        
-        # Exit with the signal number
-        sys.exit(128 + signum)
-    
-    # Register signal handlers
-    signal.signal(signal.SIGTERM, signal_handler)  # Termination
-    signal.signal(signal.SIGINT, signal_handler)   # Interrupt (Ctrl+C)
-    signal.signal(signal.SIGHUP, signal_handler)   # Hangup
-    
-    print("[Signal] ✅ Signal handlers registered for graceful shutdown")
-
-def cleanup_temp_files():
-    """Clean up temporary files and directories"""
-    try:
-        import shutil
-        import glob
-        
-        # Clean up groq_chunks directories
-        for temp_dir in glob.glob("**/groq_chunks", recursive=True):
-            try:
-                shutil.rmtree(temp_dir)
-                print(f"[Cleanup] Removed temporary directory: {temp_dir}")
-            except Exception as e:
-                print(f"[Cleanup] Warning: Could not remove {temp_dir}: {e}")
-        
-        # Clean up other temporary files
-        temp_patterns = [
-            "**/audio_from_railway.mp3",
-            "**/cached_audio.mp3", 
-            "**/downloaded_audio.*",
-            "**/vocals.wav",
-            "**/temp_*.wav",
-            "**/temp_*.mp3"
-        ]
-        
-        for pattern in temp_patterns:
-            for temp_file in glob.glob(pattern, recursive=True):
-                try:
-                    Path(temp_file).unlink()
-                    print(f"[Cleanup] Removed temporary file: {temp_file}")
-                except Exception as e:
-                    print(f"[Cleanup] Warning: Could not remove {temp_file}: {e}")
-                    
-    except Exception as e:
-        print(f"[Cleanup] Error during temp file cleanup: {e}")
-
 def with_error_recovery(func):
     """Decorator for functions with automatic error recovery"""
     def wrapper(*args, **kwargs):
@@ -391,9 +309,6 @@ def with_error_recovery(func):
                 if attempt < max_retries - 1:
                     print(f"[Recovery] Attempt {attempt + 1} failed: {e}, retrying in {retry_delay}s...")
                     
-                    # Clean up resources before retry
-                    safe_gpu_memory_cleanup()
-                    
                     # Exponential backoff
                     import time
                     time.sleep(retry_delay)
@@ -410,7 +325,6 @@ def monitor_system_resources():
     """Monitor system resources and provide warnings"""
     try:
         import psutil
-        import GPUtil
         
         # CPU usage
         cpu_percent = psutil.cpu_percent(interval=1)
@@ -425,6 +339,7 @@ def monitor_system_resources():
         
         # GPU usage (if available)
         try:
+            import GPUtil
             gpus = GPUtil.getGPUs()
             for i, gpu in enumerate(gpus):
                 if gpu.memoryUtil * 100 > 90:
@@ -614,9 +529,6 @@ def with_error_recovery(func):
                 if attempt < max_retries - 1:
                     print(f"[Recovery] Attempt {attempt + 1} failed: {e}, retrying in {retry_delay}s...")
                     
-                    # Clean up resources before retry
-                    safe_gpu_memory_cleanup()
-                    
                     # Exponential backoff
                     import time
                     time.sleep(retry_delay)
@@ -844,9 +756,9 @@ def setup_cookie_authentication(temp_path: Path) -> Optional[str]:
             print("[Modal] ❌ Cookie file creation failed")
     
     # Method 2: Check for existing cookie file (fallback)
-    existing_cookie_files = list(temp_path.glob("youtube_cookies*.txt"))
-    if existing_cookie_files:
-        cookie_file = str(existing_cookie_files[0])
+    existing_cookie_file = next(temp_path.glob("youtube_cookies*.txt"), None)
+    if existing_cookie_file:
+        cookie_file = str(existing_cookie_file)
         print(f"[Modal] 📋 Using existing cookie file: {cookie_file}")
         return cookie_file
     
@@ -922,20 +834,20 @@ def select_optimal_transcription_service(audio_path):
         # Decision matrix
         services = []
         
-        # Groq (fastest, but size limited)
-        if groq_key and file_size_mb <= 20:
+        # Faster-Whisper GPU (local, no upload or API round-trip)
+        if cuda_available:
             services.append({
-                "name": "groq",
+                "name": "faster_whisper_gpu",
                 "priority": 1,
-                "reason": f"Fastest option, file size ({file_size_mb:.1f}MB) within limits"
+                "reason": f"GPU acceleration available ({gpu_name})"
             })
         
-        # Faster-Whisper GPU (fast with GPU)
-        if cuda_available:
+        # Groq (fast remote option, but size limited)
+        if groq_key and file_size_mb <= 20:
             services.append({
-                "name": "faster_whisper_gpu",
+                "name": "groq",
                 "priority": 2,
-                "reason": f"GPU acceleration available ({gpu_name})"
+                "reason": f"Fast remote option, file size ({file_size_mb:.1f}MB) within limits"
             })
         
         # OpenAI Whisper (reliable, size limited)
@@ -965,76 +877,282 @@ def select_optimal_transcription_service(audio_path):
         print(f"[Selection] Error in service selection: {e}, using CPU fallback")
         return "faster_whisper_cpu", []
 
+# Per-container cache for clients and models; survives across requests
+# served by the same warm Modal container
+model_cache: Dict[str, Any] = {}
+model_cache_lock = threading.Lock()
+
+def get_or_create_openai_client(api_key: str):
+    """Return a cached OpenAI client so warm containers reuse its connection pool"""
+    cache_key = f"openai_client_{api_key[-8:] if api_key else 'none'}"
+    
+    if cache_key not in model_cache:
+        model_cache[cache_key] = OpenAI(api_key=api_key)
+        print("[Cache] Created OpenAI client")
+    
+    return model_cache[cache_key]
+
+def get_or_create_groq_client(api_key: str):
+    """Return a cached Groq client so warm containers reuse its connection pool"""
+    cache_key = f"groq_client_{api_key[-8:] if api_key else 'none'}"
+    
+    if cache_key not in model_cache:
+        model_cache[cache_key] = Groq(api_key=api_key)
+        print("[Cache] Created Groq client")
+    
+    return model_cache[cache_key]
+
+def get_or_load_faster_whisper_model(model_size: str, device: str, compute_type: str):
+    """Load a faster-whisper model once per container and reuse it"""
+    cache_key = f"faster_whisper_{model_size}_{device}_{compute_type}"
+    
+    if cache_key not in model_cache:
+        # Concurrent requests must not load the same multi-GB model twice
+        with model_cache_lock:
+            if cache_key not in model_cache:
+                print(f"[Cache] Loading faster-whisper {model_size} on {device} ({compute_type})")
+                load_start = time.time()
+                model_cache[cache_key] = WhisperModel(model_size, device=device, compute_type=compute_type)
+                print(f"[Cache] Model loaded in {time.time() - load_start:.2f}s")
+    
+    return model_cache[cache_key]
+
+def get_or_load_batched_whisper_model(model_size: str, device: str, compute_type: str):
+    """Wrap the cached model in a batched pipeline (shares weights, no extra VRAM)"""
+    cache_key = f"faster_whisper_batched_{model_size}_{device}_{compute_type}"
+    
+    if cache_key not in model_cache:
+        model = get_or_load_faster_whisper_model(model_size, device, compute_type)
+        with model_cache_lock:
+            if cache_key not in model_cache:
+                model_cache[cache_key] = BatchedInferencePipeline(model=model)
+    
+    return model_cache[cache_key]
+
+# Batched GPU decodes running in this container; concurrent inputs share the GPU
+active_gpu_decodes = 0
+active_gpu_decodes_lock = threading.Lock()
+
+@contextmanager
+def gpu_decode_slot():
+    """Count a batched GPU decode as in flight; yields how many are now running"""
+    global active_gpu_decodes
+    with active_gpu_decodes_lock:
+        active_gpu_decodes += 1
+        active_decodes = active_gpu_decodes
+    try:
+        yield active_decodes
+    finally:
+        with active_gpu_decodes_lock:
+            active_gpu_decodes -= 1
+
+def get_batched_inference_batch_size(active_decodes: int = 1) -> int:
+    """Size batches to this decode's share of free VRAM, at most 24"""
+    try:
+        free_bytes, _ = torch.cuda.mem_get_info()
+        # Roughly 0.25 GB of activations per batched 30s chunk. Free VRAM is
+        # split between in-flight decodes, since they probe before allocating
+        per_decode_bytes = free_bytes / max(1, active_decodes)
+        return max(4, min(24, int(per_decode_bytes / (0.25 * 1024**3))))
+    except Exception:
+        return 16
+
+def warm_local_transcription_model():
+    """Load the default GPU model ahead of time so it's ready when audio arrives"""
+    device, compute_type = get_optimal_device_and_compute_type()
+    if device == "cuda":
+        get_or_load_faster_whisper_model("large-v3", device, compute_type)
+
+def read_int_env(name: str, default: int) -> int:
+    """Read an integer env var, falling back to the default on a bad value"""
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        print(f"[Config] ⚠️ Invalid {name}={os.environ.get(name)!r}, using {default}")
+        return default
+
+# BatchedInferencePipeline only uses the first temperature and never re-decodes,
+# so the GPU path keeps beam search. The sequential CPU path decodes greedily
+# and re-decodes segments that trip faster-whisper's compression-ratio/log-prob
+# guards at the next temperature, capped at 0.4 to bound the retry cost
+WHISPER_BATCHED_BEAM_SIZE = read_int_env("WHISPER_BATCHED_BEAM_SIZE", 5)
+WHISPER_BEAM_SIZE = read_int_env("WHISPER_BEAM_SIZE", 1)
+WHISPER_TEMPERATURES = (0.0, 0.2, 0.4)
+
+def transcribe_with_faster_whisper(audio_path: Path, model_size: str = "large-v3", device: Optional[str] = None) -> Dict[str, Any]:
+    """Transcribe locally with faster-whisper on the container's GPU (or CPU)"""
+    try:
+        optimal_device, compute_type = get_optimal_device_and_compute_type()
+        if device is None:
+            device = optimal_device
+        elif device != optimal_device:
+            compute_type = "int8"
+        
+        print(f"Transcribing with faster-whisper ({model_size}, {device}): {audio_path}")
+        
+        # Hold a decode slot until the segment iterator is drained: faster-whisper
+        # decodes lazily, so the GPU work happens in the loop below
+        decode_slot = gpu_decode_slot() if device == "cuda" else nullcontext()
+        with decode_slot as active_decodes:
+            if device == "cuda":
+                # Long inputs: VAD-split speech chunks go through the GPU in batches
+                # instead of one 30s window at a time
+                batched_model = get_or_load_batched_whisper_model(model_size, device, compute_type)
+                segments_iter, info = batched_model.transcribe(
+                    str(audio_path),
+                    batch_size=get_batched_inference_batch_size(active_decodes),
+                    beam_size=WHISPER_BATCHED_BEAM_SIZE,
+                    word_timestamps=True
+                )
+            else:
+                model = get_or_load_faster_whisper_model(model_size, device, compute_type)
+                segments_iter, info = model.transcribe(
+                    str(audio_path),
+                    beam_size=WHISPER_BEAM_SIZE,
+                    temperature=WHISPER_TEMPERATURES,
+                    word_timestamps=True,
+                    vad_filter=True  # Skip non-speech stretches (instrumental breaks)
+                )
+            
+            segments = []
+            text_parts = []
+            for segment_id, segment in enumerate(segments_iter):
+                text_parts.append(segment.text.strip())
+                segments.append({
+                    "id": segment_id,
+                    "start": segment.start,
+                    "end": segment.end,
+                    "text": segment.text.strip(),
+                    "words": [
+                        {
+                            "word": w.word.strip(),
+                            "start": w.start,
+                            "end": w.end,
+                            "probability": w.probability
+                        } for w in (segment.words or [])
+                    ]
+                })
+        
+        result = {
+            "segments": segments,
+            "language": info.language,
+            "language_probability": info.language_probability,
+            "duration": info.duration,
+            "text": " ".join(text_parts)
+        }
+        
+        print(f"faster-whisper transcription completed: {len(segments)} segments")
+        return result
+        
+    except Exception as e:
+        print(f"faster-whisper transcription error: {e}")
+        raise
+
+def extract_word_fields(word_data) -> tuple:
+    """Return (word, start, end) from an API word entry (dict or SDK object)"""
+    if isinstance(word_data, dict):
+        return word_data.get('word', ''), word_data.get('start', 0), word_data.get('end', 0)
+    return getattr(word_data, 'word', ''), getattr(word_data, 'start', 0), getattr(word_data, 'end', 0)
+
+def build_segments_from_words(words, words_per_segment: int = 10) -> List[Dict[str, Any]]:
+    """Group API word timestamps into fixed-size segments"""
+    # Normalize every word once, then cut fixed-size groups by slicing
+    word_fields = [extract_word_fields(w) for w in words]
+    word_texts = [text for text, _, _ in word_fields]
+    word_dicts = [
+        {"word": text, "start": start, "end": end, "probability": 0.9}
+        for text, start, end in word_fields
+    ]
+    
+    segments = []
+    for segment_id, offset in enumerate(range(0, len(word_dicts), words_per_segment)):
+        group = word_dicts[offset:offset + words_per_segment]
+        segments.append({
+            "id": segment_id,
+            "start": group[0]["start"],
+            "end": group[-1]["end"],
+            "text": " ".join(word_texts[offset:offset + words_per_segment]),
+            "words": group
+        })
+    
+    return segments
+
+def transcribe_with_groq(audio_path: Path, api_key: str, language: Optional[str] = None) -> Dict[str, Any]:
+    """Primary transcription using Groq's hosted Whisper, chunking files over its size limit"""
+    try:
+        client = get_or_create_groq_client(api_key)
+        
+        # Groq retired the English-only distil-whisper-large-v3-en; turbo is its
+        # fastest remaining Whisper and handles lyrics in any language. A known
+        # language is passed through so Groq skips detection
+        model = "whisper-large-v3-turbo"
+        request_options = {
+            "model": model,
+            "response_format": "verbose_json",
+            "timestamp_granularities": ["word"]
+        }
+        if language:
+            request_options["language"] = language
+        
+        print(f"Transcribing with Groq ({model}): {audio_path}")
+        
+        chunk_paths = chunk_audio_for_groq(audio_path)
+        chunk_results = []
+        try:
+            for chunk_path in chunk_paths:
+                # Hand the SDK the open file so the multipart upload streams from disk
+                with open(chunk_path, "rb") as file:
+                    transcription = client.audio.transcriptions.create(
+                        file=(chunk_path.name, file),
+                        **request_options
+                    )
+                
+                segments = build_segments_from_words(getattr(transcription, 'words', None) or [])
+                chunk_results.append({
+                    "segments": segments,
+                    "language": getattr(transcription, 'language', None) or language or 'en',
+                    "language_probability": 0.95,
+                    "duration": getattr(transcription, 'duration', None) or (segments[-1]['end'] if segments else 0),
+                    "text": getattr(transcription, 'text', '')
+                })
+        finally:
+            # Chunks sit in this request's temp dir; drop them once uploaded
+            # rather than waiting for the request to finish
+            if chunk_paths != [audio_path]:
+                shutil.rmtree(chunk_paths[0].parent, ignore_errors=True)
+        
+        if len(chunk_results) == 1:
+            result = chunk_results[0]
+        else:
+            result = merge_chunked_transcriptions(chunk_results, audio_path)
+        
+        print(f"Groq transcription completed: {len(result['segments'])} segments")
+        return result
+        
+    except Exception as e:
+        print(f"Groq transcription error: {e}")
+        raise
+
 def transcribe_with_openai_whisper(audio_path: Path, api_key: str) -> Dict[str, Any]:
     """Fallback transcription using OpenAI Whisper API"""
     try:
-        from openai import OpenAI
-        
-        client = OpenAI(api_key=api_key)
+        client = get_or_create_openai_client(api_key)
         
         print(f"Transcribing with OpenAI Whisper: {audio_path}")
         
-        # Read audio file
+        # Stream the audio file into the upload instead of reading it into memory
         with open(audio_path, "rb") as file:
             transcription = client.audio.transcriptions.create(
-                file=(audio_path.name, file.read()),
+                file=(audio_path.name, file),
                 model="whisper-1",
                 response_format="verbose_json",
                 timestamp_granularities=["word"]
             )
         
         # Convert OpenAI response to our expected format
-        segments = []
-        words = getattr(transcription, 'words', [])
-        
-        if words:
-            current_segment = []
-            segment_start = None
-            segment_id = 0
-            
-            for i, word_data in enumerate(words):
-                if isinstance(word_data, dict):
-                    word_text = word_data.get('word', '')
-                    word_start = word_data.get('start', 0)
-                    word_end = word_data.get('end', 0)
-                else:
-                    word_text = getattr(word_data, 'word', '')
-                    word_start = getattr(word_data, 'start', 0)
-                    word_end = getattr(word_data, 'end', 0)
-                
-                if segment_start is None:
-                    segment_start = word_start
-                
-                current_segment.append({
-                    'word': word_text,
-                    'start': word_start,
-                    'end': word_end
-                })
-                
-                if len(current_segment) >= 10 or i == len(words) - 1:
-                    segment_text = " ".join([w['word'] for w in current_segment])
-                    segment_end = current_segment[-1]['end']
-                    
-                    segments.append({
-                        "id": segment_id,
-                        "start": segment_start,
-                        "end": segment_end,
-                        "text": segment_text,
-                        "words": [
-                            {
-                                "word": w['word'],
-                                "start": w['start'],
-                                "end": w['end'],
-                                "probability": 0.9
-                            } for w in current_segment
-                        ]
-                    })
-                    
-                    current_segment = []
-                    segment_start = None
-                    segment_id += 1
+        segments = build_segments_from_words(getattr(transcription, 'words', None) or [])
         
-        duration = words[-1]['end'] if words else 0
+        duration = segments[-1]['end'] if segments else 0
         
         result = {
             "segments": segments,
@@ -1071,9 +1189,13 @@ def transcribe_with_fallback_chain(audio_path: Path) -> Dict[str, Any]:
         ("groq", lambda: transcribe_with_groq(audio_path, os.environ.get("GROQ_API_KEY"))),
         ("faster_whisper_gpu", lambda: transcribe_with_faster_whisper(audio_path)),
         ("openai_whisper", lambda: transcribe_with_openai_whisper(audio_path, os.environ.get("OPENAI_API_KEY"))),
-        ("faster_whisper_cpu", lambda: transcribe_with_faster_whisper(audio_path, "large-v3"))  # Force CPU
+        ("faster_whisper_cpu", lambda: transcribe_with_faster_whisper(audio_path, "large-v3", device="cpu"))
     ]
     
+    # Try services in the order chosen by the selector; unranked ones go last
+    service_rank = {service['name']: service['priority'] for service in available_services}
+    fallback_chain.sort(key=lambda entry: service_rank.get(entry[0], len(service_rank) + 1))
+    
     # Try services in order
     transcription_result = None
     used_service = None
@@ -1120,9 +1242,6 @@ def transcribe_with_fallback_chain(audio_path: Path) -> Dict[str, Any]:
                     service_name, file_size_mb, cuda_available, 
                     False, error_msg, attempt_duration
                 )
-                
-                # Clean up on failure
-                safe_gpu_memory_cleanup()
                 continue
     
     if transcription_result and used_service:
@@ -1135,11 +1254,9 @@ def transcribe_with_fallback_chain(audio_path: Path) -> Dict[str, Any]:
 def enhanced_transcription_orchestrator(audio_path: Path) -> Dict[str, Any]:
     """Enhanced transcription orchestrator with comprehensive error handling"""
     try:
-        # Setup signal handlers for graceful shutdown
-        setup_signal_handlers()
-        
-        # Monitor system resources
-        monitor_system_resources()
+        # Monitor system resources in the background; psutil's CPU sample
+        # blocks for a second, so overlap it with transcription
+        threading.Thread(target=monitor_system_resources, daemon=True).start()
         
         # Use the fallback chain for transcription
         result = transcribe_with_fallback_chain(audio_path)
@@ -1149,24 +1266,32 @@ def enhanced_transcription_orchestrator(audio_path: Path) -> Dict[str, Any]:
         if not is_valid:
             raise Exception(f"Final transcription result validation failed: {validation_msg}")
         
-        # Clean up resources
-        safe_gpu_memory_cleanup()
-        cleanup_temp_files()
-        
         return result
         
     except Exception as e:
         print(f"[Orchestrator] ❌ Transcription orchestrator failed: {e}")
         
-        # Final cleanup
-        safe_gpu_memory_cleanup()
-        cleanup_temp_files()
-        
         raise
 
 
+# Shared HTTP session so warm containers reuse TCP/TLS connections to the audio host;
+# the pool is sized for the concurrent requests a container accepts, and transient
+# gateway errors from the CDN are retried instead of failing the job
+http_session = requests.Session()
+http_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+)
+http_session.mount("https://", http_adapter)
+http_session.mount("http://", http_adapter)
+
 # FastAPI Web Application
-web_app = FastAPI(title="YouTube Transcription API", version="1.0.0")
+web_app = FastAPI(
+    title="YouTube Transcription API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse
+)
 
 # Configure CORS
 web_app.add_middleware(
@@ -1177,6 +1302,18 @@ web_app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress transcription payloads on the wire; word-level JSON is highly redundant
+web_app.add_middleware(GZipMiddleware, minimum_size=1000)
+
+def download_audio(audio_url: str, audio_path: Path):
+    """Stream the audio file to disk (blocking; run off the event loop)"""
+    with http_session.get(audio_url, stream=True, timeout=(5, 60)) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True  # Honor Content-Encoding when reading the raw stream
+
+        with open(audio_path, 'wb') as f:
+            shutil.copyfileobj(response.raw, f, length=1024 * 1024)
+
 @web_app.get("/health")
 async def health_check():
     """Health check endpoint"""
@@ -1203,31 +1340,24 @@ async def transcribe_endpoint(request: Dict[str, Any]):
         if not audio_url:
             raise HTTPException(status_code=400, detail="audio_url is required")
 
-        # Download audio file
-        import tempfile
-        import requests
-        from pathlib import Path
-
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
             audio_path = temp_path / f"audio_{job_id}.mp3"
 
+            # Download audio file
             print(f"[WebAPI] 📥 Downloading audio from: {audio_url}")
-            response = requests.get(audio_url, stream=True)
-            response.raise_for_status()
-
-            with open(audio_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            await run_in_threadpool(download_audio, audio_url, audio_path)
 
             print(f"[WebAPI] ✅ Audio downloaded: {audio_path}")
 
             # Perform transcription
             print(f"[WebAPI] 🎯 Starting transcription with model: {openai_model}")
-            result = enhanced_transcription_orchestrator(audio_path)
+            result = await run_in_threadpool(enhanced_transcription_orchestrator, audio_path)
 
             print(f"[WebAPI] ✅ Transcription completed for job {job_id}")
-            return result
+            # Returning the response directly skips FastAPI's jsonable_encoder
+            # walk over every word dict; orjson serializes the result as-is
+            return ORJSONResponse(result)
 
     except HTTPException:
         raise
@@ -1238,14 +1368,43 @@ async def transcribe_endpoint(request: Dict[str, Any]):
         raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
 
 
-# Web endpoint function for Modal
-@app.function(
+# Web endpoint class for Modal: the enter hook ties model loading to the
+# container rather than to individual requests
+@app.cls(
     image=image,
     timeout=1800,
     memory=4096,
-    gpu="A10G"
+    gpu="A10G",
+    volumes={MODEL_DIR: weights_volume},
+    scaledown_window=120  # Keep containers warm between jobs; Modal scales down when idle
 )
-@modal.fastapi_endpoint()
-def web_endpoint():
-    """Web endpoint function that exposes the FastAPI app"""
-    return web_app
+@modal.concurrent(max_inputs=4)  # Download/API stages leave the GPU idle; share it across jobs
+class TranscriptionService:
+    @modal.enter()
+    def load_models(self):
+        """Load the GPU model once per container, before any request is routed here"""
+        # A failed preload must not keep the container from serving: the
+        # fallback chain retries the local model and the hosted APIs per request
+        try:
+            warm_local_transcription_model()
+        except Exception as e:
+            print(f"[Startup] ⚠️ Model preload failed, continuing without it: {e}")
+
+    @modal.asgi_app(label="youtube-transcription-v3-web-endpoint")  # Keep the URL the Node client calls
+    def web_endpoint(self):
+        """Web endpoint that exposes the FastAPI app"""
+        return web_app
+
+
+@app.function(
+    image=image,
+    timeout=1800,
+    volumes={MODEL_DIR: weights_volume}
+)
+def download_weights():
+    """Pre-populate the weights volume (run once: modal run modal/transcribe.py::download_weights)"""
+    from faster_whisper import download_model
+    
+    model_path = download_model("large-v3")
+    weights_volume.commit()
+    print(f"[Weights] ✅ faster-whisper large-v3 cached at {model_path}")